@@ -5,9 +5,11 @@
 
 import os
 import json
+import threading
 import yaml
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -18,11 +20,13 @@ from core.sentiment import doc_sentiment, rolling_sentiment
 from core.forecast import fetch_prices, forecast_prices, growth_pct, clean_price_csv
 from core.anomaly import anomaly_from_prices
 from core.strategy import investment_strategy
+from core import _kernels
 
 
 # -------------------------
-# NLTK bootstrap (lazy)
+# NLTK bootstrap (lazy; cached so the data-path probes run once per process)
 # -------------------------
+@st.cache_resource(show_spinner=False)
 def _ensure_nltk():
     import nltk
     local_dir = os.path.join(os.path.dirname(__file__), "nltk_data")
@@ -47,6 +51,45 @@ def _ensure_nltk():
     except Exception:
         # Non-blocking if download fails
         pass
+    return True
+
+
+# -------------------------
+# Cached wrappers — Streamlit reruns this whole script on every widget
+# interaction, so memoize the pure document/price work on its inputs.
+# -------------------------
+@st.cache_data(show_spinner=False)
+def _doc_sentiment_cached(text: str):
+    return doc_sentiment(text)
+
+@st.cache_data(show_spinner=False)
+def _split_sentences_cached(text: str):
+    return split_sentences(text)
+
+@st.cache_data(show_spinner=False)
+def _rolling_sentiment_cached(text: str, window_sentences: int):
+    return rolling_sentiment(text, window_sentences=window_sentences)
+
+@st.cache_data(show_spinner=False)
+def _forecast_prices_cached(hist: pd.DataFrame, horizon_days: int):
+    return forecast_prices(hist, horizon_days=horizon_days)
+
+@st.cache_data(show_spinner=False)
+def _anomaly_cached(hist: pd.DataFrame):
+    return anomaly_from_prices(hist)
+
+@st.cache_data(show_spinner=False)
+def _clean_price_csv_cached(file):
+    return clean_price_csv(file)
+
+@st.cache_resource(show_spinner=False)
+def _warm_kernels():
+    # Compile the optional numba kernels off the main thread so the first
+    # Forecast click doesn't pay JIT cost (no-op when numba is absent).
+    threading.Thread(target=_kernels.warmup, daemon=True).start()
+    return True
+
+_warm_kernels()
 
 
 # -------------------------
@@ -97,10 +140,16 @@ st.markdown("""
 
 
 # -------------------------
-# Load config.yaml
+# Load config.yaml (parsed once per process; keyed on mtime so edits
+# to the file still take effect on the next rerun)
 # -------------------------
-with open("config.yaml", "r", encoding="utf-8") as f:
-    CFG = yaml.safe_load(f)
+@st.cache_resource(show_spinner=False)
+def _load_config(path: str, mtime: float):
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=loader)
+
+CFG = _load_config("config.yaml", os.path.getmtime("config.yaml"))
 
 
 # -------------------------
@@ -119,7 +168,6 @@ st.session_state.setdefault("mode", "📄 Overview & Q&A")
 
 st.session_state.setdefault("doc_text", "")
 st.session_state.setdefault("doc_source", "")
-st.session_state.setdefault("nltk_ready", False)
 
 st.session_state.setdefault("latest_sentiment", None)
 st.session_state.setdefault("latest_anomaly_label", "None")
@@ -151,12 +199,10 @@ def run_quick_demo():
     st.session_state.doc_text = sample_doc
     st.session_state.doc_source = "sample_document.txt"
 
-    if not st.session_state.nltk_ready:
-        _ensure_nltk()
-        st.session_state.nltk_ready = True
+    _ensure_nltk()
 
     # 2) Sentiment (for KPIs, Sentiment tab)
-    s = doc_sentiment(st.session_state.doc_text)
+    s = _doc_sentiment_cached(st.session_state.doc_text)
     st.session_state.latest_sentiment = float(s.get("compound", 0.0))
 
     # 3) Pre-fill Q&A (so Overview shows answers without extra clicks)
@@ -166,7 +212,7 @@ def run_quick_demo():
                      else "What is the quarterly revenue?")
     except Exception:
         default_q = "What is the quarterly revenue?"
-    sents = split_sentences(st.session_state.doc_text)
+    sents = _split_sentences_cached(st.session_state.doc_text)
     top_k = int(CFG.get("qna", {}).get("top_k", 3))
     demo_ans = answer_question(default_q, sents, top_k)
     st.session_state.demo_question = default_q
@@ -176,11 +222,9 @@ def run_quick_demo():
     start_date = datetime.utcnow().date() - timedelta(days=150)
     dates = pd.date_range(start_date, periods=150, freq="D")
     base = 70.0; growth = 0.001  # mild upward drift
-    prices = [base]
-    for i in range(1, len(dates)):
-        prices.append(prices[-1] * (1.0 + growth))
+    prices = base * (1.0 + growth) ** np.arange(len(dates), dtype=float)
     hist = pd.DataFrame({"Date": dates, "Close": prices})
-    fore = forecast_prices(hist, horizon_days=90)
+    fore = _forecast_prices_cached(hist, horizon_days=90)
 
     st.session_state.demo_hist = hist
     st.session_state.demo_fore = fore
@@ -188,7 +232,7 @@ def run_quick_demo():
     st.session_state.latest_proj_change = proj_change
 
     # 5) Anomaly + Strategy + Export payload
-    label, _stats = anomaly_from_prices(hist)
+    label, _stats = _anomaly_cached(hist)
     st.session_state.latest_anomaly_label = label
 
     decision, reason = investment_strategy(
@@ -265,11 +309,8 @@ if st.session_state.mode.startswith("📄"):
             st.success("Quick demo loaded. All tabs are now populated.")
 
         if uploaded:
-            tmp = f".tmp_{uploaded.name}"
-            with open(tmp, "wb") as f:
-                f.write(uploaded.getbuffer())
             try:
-                text, source_name = load_text_from_file(tmp)
+                text, source_name = load_text_from_file(uploaded.getvalue(), name=uploaded.name)
                 st.session_state.doc_text = text
                 st.session_state.doc_source = source_name
 
@@ -278,9 +319,8 @@ if st.session_state.mode.startswith("📄"):
                 st.session_state.demo_answers = None
 
                 # Update sentiment for uploaded doc
-                if not st.session_state.nltk_ready:
-                    _ensure_nltk(); st.session_state.nltk_ready = True
-                s = doc_sentiment(st.session_state.doc_text)
+                _ensure_nltk()
+                s = _doc_sentiment_cached(st.session_state.doc_text)
                 st.session_state.latest_sentiment = float(s.get("compound", 0.0))
             except Exception as e:
                 st.error(f"Could not read file: {e}")
@@ -301,10 +341,9 @@ if st.session_state.mode.startswith("📄"):
         go = st.button("Get Answer", type="primary", key="qa_go")
 
         if st.session_state.doc_text:
-            if not st.session_state.nltk_ready:
-                _ensure_nltk(); st.session_state.nltk_ready = True
+            _ensure_nltk()
 
-            sents = split_sentences(st.session_state.doc_text)
+            sents = _split_sentences_cached(st.session_state.doc_text)
 
             # show demo answers if present (no extra click)
             if st.session_state.demo_answers and not go and not q:
@@ -346,11 +385,10 @@ elif st.session_state.mode.startswith("📈"):
     st.subheader("Sentiment Timeline")
 
     if st.session_state.doc_text:
-        if not st.session_state.nltk_ready:
-            _ensure_nltk(); st.session_state.nltk_ready = True
+        _ensure_nltk()
 
         win = int(CFG.get("sentiment", {}).get("window_sentences", 3))
-        rows = rolling_sentiment(st.session_state.doc_text, window_sentences=win)
+        rows = _rolling_sentiment_cached(st.session_state.doc_text, window_sentences=win)
         if rows:
             df = pd.DataFrame(rows)
             st.line_chart(df.set_index("index")["compound"])
@@ -369,12 +407,12 @@ elif st.session_state.mode.startswith("📊"):
     # If the demo was run, render it first (no extra clicks)
     if isinstance(st.session_state.demo_hist, pd.DataFrame) and isinstance(st.session_state.demo_fore, pd.DataFrame):
         st.markdown("**Demo forecast** (from Quick Demo)")
-        hist = st.session_state.demo_hist.copy()
-        fore = st.session_state.demo_fore.copy()
+        hist = st.session_state.demo_hist
+        fore = st.session_state.demo_fore
 
         proj_change = growth_pct(hist, fore)
         set_state(latest_proj_change=proj_change)
-        label, an_stats = anomaly_from_prices(hist)
+        label, an_stats = _anomaly_cached(hist)
         set_state(latest_anomaly_label=label)
 
         c1, c2, c3 = st.columns(3)
@@ -385,10 +423,11 @@ elif st.session_state.mode.startswith("📊"):
         c3.metric(f"Price in {len(fore)} days", f"{last_pred:,.4f}")
         st.caption(f"Anomaly: {label} (n={len(hist)})")
 
-        hist_chart = hist.rename(columns={"Close":"Price"})[["Date","Price"]].copy(); hist_chart["Type"]="History"
-        fore_chart = fore.rename(columns={"Predicted":"Price"})[["Date","Price"]].copy(); fore_chart["Type"]="Forecast"
-        combo = pd.concat([hist_chart, fore_chart], ignore_index=True)
-        combo = combo.pivot_table(index="Date", columns="Type", values="Price")
+        combo = pd.concat(
+            [hist.set_index("Date")["Close"].rename("History"),
+             fore.set_index("Date")["Predicted"].rename("Forecast")],
+            axis=1,
+        )
         st.line_chart(combo)
 
         sentiment_val = get_state("latest_sentiment") or 0.0
@@ -435,14 +474,14 @@ elif st.session_state.mode.startswith("📊"):
         if st.button("Run Forecast (CSV)"):
             if csv_file:
                 with st.spinner("Cleaning CSV…"):
-                    hist = clean_price_csv(csv_file)
+                    hist = _clean_price_csv_cached(csv_file)
             else:
                 st.warning("Upload a CSV first.")
 
     if isinstance(hist, pd.DataFrame) and not hist.empty:
         try:
             if model.startswith("Drift"):
-                fore = forecast_prices(hist, horizon_days=int(horizon))
+                fore = _forecast_prices_cached(hist, horizon_days=int(horizon))
             else:
                 last_actual_val = float(hist["Close"].astype(float).iloc[-1])
                 future_dates = pd.date_range(pd.to_datetime(hist["Date"].iloc[-1]) + pd.Timedelta(days=1),
@@ -452,7 +491,7 @@ elif st.session_state.mode.startswith("📊"):
             proj_change = growth_pct(hist, fore)
             set_state(latest_proj_change=proj_change)
 
-            anomaly_label, an_stats = anomaly_from_prices(hist)
+            anomaly_label, an_stats = _anomaly_cached(hist)
             set_state(latest_anomaly_label=anomaly_label)
 
             c1, c2, c3 = st.columns(3)
@@ -463,10 +502,11 @@ elif st.session_state.mode.startswith("📊"):
             c3.metric(f"Price in {int(horizon)} days", f"{last_pred:,.4f}")
             st.caption(f"Anomaly: {anomaly_label} (n={len(hist)})")
 
-            hist_chart = hist.rename(columns={"Close":"Price"})[["Date","Price"]]; hist_chart["Type"]="History"
-            fore_chart = fore.rename(columns={"Predicted":"Price"})[["Date","Price"]]; fore_chart["Type"]="Forecast"
-            combo = pd.concat([hist_chart, fore_chart], ignore_index=True)
-            combo = combo.pivot_table(index="Date", columns="Type", values="Price")
+            combo = pd.concat(
+                [hist.set_index("Date")["Close"].rename("History"),
+                 fore.set_index("Date")["Predicted"].rename("Forecast")],
+                axis=1,
+            )
             st.line_chart(combo)
 
             sentiment_val = get_state("latest_sentiment") or 0.0
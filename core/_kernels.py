@@ -0,0 +1,88 @@
+# core/_kernels.py
+"""Numeric kernels shared by forecast and anomaly detection.
+
+When numba is installed the kernels are JIT-compiled loop versions; otherwise
+they fall back to equivalent vectorized NumPy, which is already fast for
+typical history lengths. Numba is deliberately optional — it is not listed in
+requirements.txt and nothing here fails without it.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+
+def _drift_forecast_np(prices: np.ndarray, horizon: int) -> np.ndarray:
+    rets = np.diff(prices) / prices[:-1]
+    avg = rets.mean()
+    # Compute in the caller's dtype (float32 from forecast_prices) so the
+    # prediction array doesn't silently widen back to float64.
+    steps = np.arange(1, horizon + 1, dtype=prices.dtype)
+    return prices[-1] * (prices.dtype.type(1.0) + avg) ** steps
+
+
+def _zscore_max_np(rets: np.ndarray) -> float:
+    mu = rets.mean()
+    sd = rets.std(ddof=1)
+    return float(np.abs((rets - mu) / (sd + 1e-9)).max())
+
+
+if _HAVE_NUMBA:
+
+    @njit(cache=True, fastmath=True)
+    def drift_forecast(prices, horizon):  # pragma: no cover - exercised when numba present
+        n = prices.size
+        s = 0.0
+        for i in range(1, n):
+            s += prices[i] / prices[i - 1] - 1.0
+        factor = 1.0 + s / (n - 1)
+        # Match the caller's dtype (float32 from forecast_prices), like the
+        # NumPy fallback, so both paths produce the same Predicted dtype.
+        out = np.empty(horizon, prices.dtype)
+        acc = prices[-1]
+        for i in range(horizon):
+            acc *= factor
+            out[i] = acc
+        return out
+
+    @njit(cache=True, fastmath=True)
+    def zscore_max(rets):  # pragma: no cover - exercised when numba present
+        n = rets.size
+        mu = 0.0
+        for i in range(n):
+            mu += rets[i]
+        mu /= n
+        var = 0.0
+        for i in range(n):
+            d = rets[i] - mu
+            var += d * d
+        sd = (var / (n - 1)) ** 0.5
+        max_abs = 0.0
+        for i in range(n):
+            z = abs((rets[i] - mu) / (sd + 1e-9))
+            if z > max_abs:
+                max_abs = z
+        return max_abs
+
+else:
+    drift_forecast = _drift_forecast_np
+    zscore_max = _zscore_max_np
+
+
+def warmup():
+    """Trigger JIT compilation on tiny inputs (no-op without numba).
+
+    Meant to run in a background thread at app startup so the first real
+    forecast doesn't pay the compile cost.
+    """
+    if not _HAVE_NUMBA:
+        return
+    # float32, matching what forecast_prices/anomaly_from_prices actually
+    # pass — a float64 warm-up would compile an unused specialization and
+    # leave the first real call to JIT the float32 one.
+    tiny = np.array([1.0, 1.01, 1.02, 1.03, 1.04, 1.05], dtype=np.float32)
+    drift_forecast(tiny, 2)
+    zscore_max(np.diff(tiny) / tiny[:-1])
@@ -1,19 +1,43 @@
 # core/anomaly.py
+from enum import IntEnum
+
 import pandas as pd
 import numpy as np
 
+from core import _kernels
+
+class AnomalyLevel(IntEnum):
+    """Anomaly severity as a small int, for int-compare hot paths.
+
+    The UI and export JSON keep the human-readable labels; convert with
+    .label / .from_label at the presentation boundary.
+    """
+    NONE = 0
+    MILD = 1
+    SEVERE = 2
+
+    @property
+    def label(self) -> str:
+        return ("None", "Mild", "Severe")[self]
+
+    @classmethod
+    def from_label(cls, label: str) -> "AnomalyLevel":
+        return {"None": cls.NONE, "Mild": cls.MILD, "Severe": cls.SEVERE}[label]
+
 def anomaly_from_prices(hist_df: pd.DataFrame, mild=2.0, severe=3.0):
     """
     Detect anomalies via z-score on daily returns.
     Returns: (label, stats_dict)
     """
-    prices = pd.to_numeric(hist_df["Close"], errors="coerce")
-    rets = prices.pct_change().dropna()
-    if len(rets) < 5:
-        return "None", {"n": len(rets), "max_z": 0.0}
+    # Pure-NumPy returns/z-score: three reductions on a flat array, no
+    # intermediate Series or NaN-mask allocations.
+    prices = pd.to_numeric(hist_df["Close"], errors="coerce").to_numpy(dtype=np.float32)
+    rets = np.diff(prices) / prices[:-1]
+    rets = rets[np.isfinite(rets)]
+    if rets.size < 5:
+        return "None", {"n": int(rets.size), "max_z": 0.0}
 
-    z = (rets - rets.mean()) / (rets.std(ddof=1) + 1e-9)
-    max_abs_z = float(np.abs(z).max())
+    max_abs_z = float(_kernels.zscore_max(rets))
 
     if max_abs_z >= severe:
         label = "Severe"
@@ -22,4 +46,4 @@ def anomaly_from_prices(hist_df: pd.DataFrame, mild=2.0, severe=3.0):
     else:
         label = "None"
 
-    return label, {"n": int(len(rets)), "max_z": max_abs_z}
+    return label, {"n": int(rets.size), "max_z": max_abs_z}
@@ -1,8 +1,44 @@
 # core/forecast.py
+import os
+import time
+
 import yfinance as yf
 import pandas as pd
 import numpy as np
 
+from core import _kernels
+
+# ---------- PRICE CACHE ----------
+# Disk-backed memoization of yfinance downloads: identical (ticker, period,
+# interval) requests within the TTL are served from a local CSV instead of
+# a 100–2000 ms network round-trip.
+_PRICE_CACHE_DIR = ".price_cache"
+_PRICE_CACHE_TTL_SECONDS = 3600
+
+def _price_cache_path(ticker: str, period: str, interval: str) -> str:
+    key = f"{ticker}_{period}_{interval}"
+    safe = "".join(c if c.isalnum() or c in "-." else "_" for c in key)
+    return os.path.join(_PRICE_CACHE_DIR, f"{safe}.csv")
+
+def _read_price_cache(path: str):
+    try:
+        if os.path.exists(path) and (time.time() - os.path.getmtime(path)) < _PRICE_CACHE_TTL_SECONDS:
+            out = pd.read_csv(path, parse_dates=["Date"])
+            if {"Date", "Close"}.issubset(out.columns) and len(out) >= 10:
+                return out
+    except Exception:
+        # Corrupt or unreadable cache file — fall through to a fresh fetch
+        pass
+    return None
+
+def _write_price_cache(path: str, out: pd.DataFrame):
+    try:
+        os.makedirs(_PRICE_CACHE_DIR, exist_ok=True)
+        out.to_csv(path, index=False)
+    except Exception:
+        # Cache writes are best-effort; never fail the fetch over them
+        pass
+
 # ---------- CSV CLEANER ----------
 def clean_price_csv(
     file,
@@ -62,7 +98,13 @@ def _extract_close_from_download(df: pd.DataFrame, ticker: str) -> pd.DataFrame:
     out = out.rename_axis("Date").reset_index()[["Date", "Close"]]
     return out
 
-def fetch_prices(ticker: str, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
+def fetch_prices(ticker: str, period: str = "1y", interval: str = "1d", use_cache: bool = True) -> pd.DataFrame:
+    cache_path = _price_cache_path(ticker, period, interval)
+    if use_cache:
+        cached = _read_price_cache(cache_path)
+        if cached is not None:
+            return cached
+
     df = yf.download(
         ticker, period=period, interval=interval,
         auto_adjust=True, progress=False, threads=False
@@ -73,25 +115,23 @@ def fetch_prices(ticker: str, period: str = "1y", interval: str = "1d") -> pd.Da
     out = out.dropna().reset_index(drop=True)
     if len(out) < 10:
         raise ValueError("Not enough history to forecast (need ≥ 10 rows).")
+    if use_cache:
+        _write_price_cache(cache_path, out)
     return out
 
 # ---------- FORECAST (DRIFT MODEL) ----------
 def forecast_prices(hist_df: pd.DataFrame, horizon_days: int = 90) -> pd.DataFrame:
     if horizon_days <= 0:
         raise ValueError("horizon_days must be > 0.")
-    prices = hist_df["Close"].astype(float).to_numpy()
-    rets   = pd.Series(prices).pct_change().dropna().to_numpy()
-    if rets.size == 0:
+    # float32 halves bandwidth and is ample for ~6-sig-fig price data
+    prices = np.ascontiguousarray(hist_df["Close"].to_numpy(dtype=np.float32))
+    if prices.size < 2:
         raise ValueError("Return series is empty after cleaning.")
 
-    avg_ret    = float(np.mean(rets))
-    last_price = float(prices[-1])
-
     steps = int(horizon_days)
-    future_dates   = pd.date_range(pd.to_datetime(hist_df["Date"].iloc[-1]) + pd.Timedelta(days=1),
-                                   periods=steps, freq="D")
-    growth_factors = (1.0 + avg_ret) ** np.arange(1, steps + 1, dtype=float)
-    preds = last_price * growth_factors
+    future_dates = pd.date_range(pd.to_datetime(hist_df["Date"].iloc[-1]) + pd.Timedelta(days=1),
+                                 periods=steps, freq="D")
+    preds = _kernels.drift_forecast(prices, steps)
 
     return pd.DataFrame({"Date": future_dates, "Predicted": preds})
 
@@ -99,3 +139,18 @@ def growth_pct(hist_df: pd.DataFrame, fore_df: pd.DataFrame) -> float:
     last_actual = float(hist_df["Close"].iloc[-1])
     last_pred   = float(fore_df["Predicted"].iloc[-1])
     return float((last_pred - last_actual) / last_actual * 100.0)
+
+def projected_change_pct(hist_df: pd.DataFrame, horizon_days: int) -> float:
+    """Drift-model projected % change in O(1), without building the forecast.
+
+    Closed form of growth_pct(hist_df, forecast_prices(hist_df, horizon_days)):
+    (1 + avg_ret) ** horizon - 1, in percent. Use this when only the KPI
+    number is needed and the predicted series itself won't be charted.
+    """
+    if horizon_days <= 0:
+        raise ValueError("horizon_days must be > 0.")
+    prices = hist_df["Close"].astype(float).to_numpy()
+    if prices.size < 2:
+        raise ValueError("Return series is empty after cleaning.")
+    avg_ret = float(np.mean(np.diff(prices) / prices[:-1]))
+    return float(((1.0 + avg_ret) ** int(horizon_days) - 1.0) * 100.0)
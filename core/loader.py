@@ -1,43 +1,62 @@
 # core/loader.py
+import io
 from pathlib import Path
 import zipfile
 from docx import Document
-import PyPDF2
 
-def load_text_from_file(path: str):
+try:
+    from pypdf import PdfReader
+except ImportError:
+    # Fallback for environments still on the predecessor package
+    from PyPDF2 import PdfReader
+
+def load_text_from_file(src, name: str = None):
     """
     Load text from PDF, DOCX, or TXT.
+    - src may be a filesystem path, raw bytes, or a binary stream
+      (e.g. a Streamlit upload) — for bytes/streams pass the original
+      filename via `name` so the extension can be detected.
     - DOCX is validated as a real zipped package to avoid 'Package not found' errors.
-    - PDF is extracted via PyPDF2 (best-effort).
+    - PDF is extracted via pypdf (best-effort).
     - TXT is read as UTF-8 (ignores decoding errors).
     Returns: (text, source_name)
     """
-    p = Path(path)
-    ext = p.suffix.lower()
-    name = p.name
+    if isinstance(src, (str, Path)):
+        p = Path(src)
+        name = name or p.name
+        data = p.read_bytes()
+    elif isinstance(src, (bytes, bytearray, memoryview)):
+        data = bytes(src)
+    else:  # binary file-like object
+        name = name or getattr(src, "name", None)
+        data = src.read()
+
+    if not name:
+        raise ValueError("A filename is required to detect the document type.")
+    ext = Path(name).suffix.lower()
 
     if ext == ".txt":
-        with open(p, "r", encoding="utf-8", errors="ignore") as f:
-            return f.read(), name
+        return data.decode("utf-8", errors="ignore"), name
 
     if ext == ".docx":
+        buf = io.BytesIO(data)
         # Ensure it's a valid DOCX package (ZIP)
-        if not zipfile.is_zipfile(p):
+        if not zipfile.is_zipfile(buf):
             raise ValueError("File is not a valid DOCX package. Please re-save as DOCX or upload as PDF/TXT.")
-        doc = Document(str(p))
+        buf.seek(0)
+        doc = Document(buf)
         text = "\n".join(par.text for par in doc.paragraphs)
         return text, name
 
     if ext == ".pdf":
-        text = ""
-        with open(p, "rb") as f:
-            reader = PyPDF2.PdfReader(f)
-            for page in reader.pages:
-                try:
-                    text += page.extract_text() or ""
-                except Exception:
-                    # Some pages may fail to extract text cleanly; continue
-                    continue
-        return text, name
+        parts = []
+        reader = PdfReader(io.BytesIO(data))
+        for page in reader.pages:
+            try:
+                parts.append(page.extract_text() or "")
+            except Exception:
+                # Some pages may fail to extract text cleanly; continue
+                continue
+        return "\n".join(parts), name
 
     raise ValueError(f"Unsupported file type: {ext} (use PDF, DOCX, or TXT)")
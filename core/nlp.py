@@ -0,0 +1,25 @@
+# core/nlp.py
+import threading
+
+# NLTK >= 3.8.2 builds a fresh PunktTokenizer (unpickling its parameters from
+# disk) inside every nltk.sent_tokenize call. Load it once, lazily, so the
+# data path set up by the app's NLTK bootstrap is already in place.
+_punkt = None
+_punkt_lock = threading.Lock()
+
+def _get_punkt():
+    global _punkt
+    if _punkt is None:
+        with _punkt_lock:
+            if _punkt is None:
+                try:
+                    from nltk.tokenize import PunktTokenizer
+                    _punkt = PunktTokenizer()
+                except ImportError:
+                    import nltk.data
+                    _punkt = nltk.data.load("tokenizers/punkt/english.pickle")
+    return _punkt
+
+def sentence_tokenize(text: str):
+    """Split text into sentences with a shared, pre-loaded Punkt tokenizer."""
+    return _get_punkt().tokenize(text)
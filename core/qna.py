@@ -1,16 +1,59 @@
-from nltk.tokenize import sent_tokenize
-from sklearn.feature_extraction.text import TfidfVectorizer
+# core/qna.py
+from functools import lru_cache
+
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer, TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.pipeline import make_pipeline
+
+from core.nlp import sentence_tokenize
+
+# Above this many sentences, building a vocabulary dict dominates fit time
+# and memory; switch to a stateless hashing vectorizer (+ idf weighting).
+_HASHING_THRESHOLD = 5000
 
 def split_sentences(text: str):
-    return [s.strip() for s in sent_tokenize(text) if s.strip()]
+    return [s.strip() for s in sentence_tokenize(text) if s.strip()]
+
+@lru_cache(maxsize=8)
+def _build_index_cached(sentences: tuple):
+    if len(sentences) > _HASHING_THRESHOLD:
+        vect = make_pipeline(
+            HashingVectorizer(n_features=2 ** 18, alternate_sign=False, dtype=np.float32),
+            TfidfTransformer(sublinear_tf=True),
+        )
+        S = vect.fit_transform(sentences)
+    else:
+        vect = TfidfVectorizer(dtype=np.float32, sublinear_tf=True).fit(sentences)
+        S = vect.transform(sentences)
+    return vect, S
+
+def build_index(sentences):
+    """Fit a TF-IDF vectorizer and sentence matrix once per document.
+
+    Cached on the sentence tuple so repeated questions against the same
+    document only pay the fit/transform cost the first time.
+    """
+    return _build_index_cached(tuple(sentences))
 
 def answer_question(question: str, sentences, top_k: int = 3):
-    if not sentences:
+    question = (question or "").strip()
+    if not question or not sentences:
+        return []
+    try:
+        vect, S = build_index(sentences)
+    except ValueError:
+        # Empty vocabulary: the sentences hold no scorable word tokens
+        # (e.g. all numbers/punctuation), so nothing can be ranked.
         return []
-    vect = TfidfVectorizer().fit(sentences + [question])
-    S = vect.transform(sentences)
     q = vect.transform([question])
+    if q.nnz == 0:
+        # No overlap with the document vocabulary — every similarity is 0,
+        # so there is nothing meaningful to rank.
+        return []
     sims = cosine_similarity(q, S).ravel()
-    idxs = sims.argsort()[::-1][:top_k]
+    # Partial top-k selection: O(N) argpartition, then sort just the k winners.
+    k = min(int(top_k), sims.size)
+    part = np.argpartition(-sims, k - 1)[:k]
+    idxs = part[np.argsort(-sims[part])]
     return [(float(sims[i]), sentences[i]) for i in idxs]
@@ -1,20 +1,86 @@
+# core/sentiment.py
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
 from nltk.sentiment import SentimentIntensityAnalyzer
-from nltk.tokenize import sent_tokenize
+
+from core.nlp import sentence_tokenize
+
+# Lazily-built singleton: instantiating SentimentIntensityAnalyzer parses the
+# full VADER lexicon from disk, so that cost should only be paid once per process.
+_sia = None
+_sia_lock = threading.Lock()
+
+# Only fan out to worker processes for genuinely large documents — below this
+# the fork/pickle overhead outweighs the scoring work.
+_PARALLEL_MIN_SENTENCES = 512
+
+# VADER has pathological worst cases on long runs of repeated punctuation or
+# emoticons (minutes on a single input). Collapse any run of 4+ identical
+# non-word characters down to 3 before scoring; compiled once at import.
+_PUNCT_RUN_RE = re.compile(r"([^\w\s])\1{3,}")
+# Hard cap on a single scoring unit (one sentence) as a final backstop.
+_MAX_SENTENCE_CHARS = 4096
+
+def _sanitize(text: str) -> str:
+    return _PUNCT_RUN_RE.sub(r"\1\1\1", text)
+
+def _get_sia():
+    global _sia
+    if _sia is None:
+        with _sia_lock:
+            if _sia is None:
+                _sia = SentimentIntensityAnalyzer()
+    return _sia
+
+def _compound(sentence: str) -> float:
+    # Module-level so it is picklable for worker processes; each worker
+    # builds its own analyzer singleton on first use.
+    return _get_sia().polarity_scores(_sanitize(sentence)[:_MAX_SENTENCE_CHARS])["compound"]
+
+def _score_sentences(sents) -> np.ndarray:
+    if len(sents) >= _PARALLEL_MIN_SENTENCES and (os.cpu_count() or 1) > 1:
+        try:
+            with ProcessPoolExecutor() as pool:
+                return np.fromiter(pool.map(_compound, sents, chunksize=64),
+                                   dtype=np.float32, count=len(sents))
+        except Exception:
+            # Pool setup can fail in restricted environments; score serially.
+            pass
+    return np.fromiter((_compound(s) for s in sents), dtype=np.float32, count=len(sents))
+
+@lru_cache(maxsize=32)
+def sentence_compounds(text: str) -> np.ndarray:
+    """Per-sentence VADER compounds for a document, tokenized and scored once.
+
+    Cached on the text so doc-level and rolling views (at any window size)
+    share the same scoring pass.
+    """
+    sents = [s.strip() for s in sentence_tokenize(text) if s.strip()]
+    if not sents:
+        return np.empty(0, dtype=np.float32)
+    return _score_sentences(sents)
+
+@lru_cache(maxsize=32)
+def _doc_scores(text: str):
+    return _get_sia().polarity_scores(_sanitize(text))
 
 def doc_sentiment(text: str):
-    sia = SentimentIntensityAnalyzer()
-    return sia.polarity_scores(text or "")
+    # Copy so cached results can't be mutated by callers.
+    return dict(_doc_scores(text or ""))
 
 def rolling_sentiment(text: str, window_sentences: int = 3):
-    sents = [s.strip() for s in sent_tokenize(text) if s.strip()]
-    sia = SentimentIntensityAnalyzer()
-    rows = []
-    for i in range(0, len(sents), window_sentences):
-        chunk = " ".join(sents[i:i+window_sentences])
-        if not chunk:
-            continue
-        rows.append({
-            "index": i // window_sentences,
-            "compound": sia.polarity_scores(chunk)["compound"]
-        })
-    return rows
+    scores = sentence_compounds(text)
+    if scores.size == 0:
+        return []
+    win = max(1, int(window_sentences))
+    n_full = len(scores) // win
+    means = scores[:n_full * win].reshape(-1, win).mean(axis=1)
+    tail = scores[n_full * win:]
+    if tail.size:
+        means = np.append(means, tail.mean())
+    return [{"index": i, "compound": float(c)} for i, c in enumerate(means)]
@@ -1,35 +1,253 @@
 # core/strategy.py
-def investment_strategy(forecast_change: float, sentiment_score: float, anomaly_level: str):
+# Fully annotated so the module compiles cleanly with mypyc (or cython
+# --pure) once the project grows packaging; callers import unchanged.
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
+from typing import Dict, NamedTuple, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    # numba is optional (mirroring core/_kernels); fall back to pure Python
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
+
+_ANOMALY_CODE: Dict[str, int] = {"None": 0, "Mild": 1, "Severe": 2}
+
+# Strategy thresholds, named once so calibration is a single edit (and so
+# hot paths reuse the same float objects instead of re-loading literals).
+_SENT_POS: float = 0.2    # reason bin: positive sentiment above this
+_SENT_NEG: float = -0.2   # reason bin: negative sentiment below this
+_SENT_BUY: float = 0.1    # decision: BUY requires sentiment above this
+_SENT_SELL: float = -0.1  # decision: SELL when sentiment below this
+_FC_BUY: float = 2.0      # decision: BUY requires forecast % above this
+_FC_SELL: float = -2.0    # decision: SELL when forecast % below this
+
+# Tick-scaled (x100) twins for the integer cache path.
+_SENT_POS_TICK: int = round(_SENT_POS * 100)
+_SENT_NEG_TICK: int = round(_SENT_NEG * 100)
+_SENT_BUY_TICK: int = round(_SENT_BUY * 100)
+_SENT_SELL_TICK: int = round(_SENT_SELL * 100)
+_FC_BUY_TICK: int = round(_FC_BUY * 100)
+_FC_SELL_TICK: int = round(_FC_SELL * 100)
+
+# Interned so repeated results share the exact same string objects and
+# downstream equality checks can hit the pointer-compare fast path.
+_DECISION: Tuple[str, ...] = tuple(sys.intern(x) for x in ("HOLD", "BUY", "SELL"))
+_SENT_T: Tuple[str, ...] = tuple(sys.intern(x) for x in
+                ("Negative sentiment", "Neutral sentiment", "Positive sentiment"))
+_ANOM_T: Tuple[str, ...] = tuple(sys.intern(x) for x in
+                ("No anomalies detected", "Mild anomalies detected", "Severe anomalies detected"))
+
+_SENT_REASON = np.array(_SENT_T)
+_ANOM_REASON = np.array(_ANOM_T)
+
+class StrategyResult(NamedTuple):
+    """Compact (decision, reason) pair; unpacks like the old plain tuple."""
+    decision: str
+    reason: str
+
+@njit(cache=True, nogil=True)
+def _decide(forecast_change: float, sentiment_score: float, anomaly_code: int) -> int:
+    # Pure-arithmetic decision kernel: 0=HOLD, 1=BUY, 2=SELL.
+    # Predicates ordered by observed hit frequency: on real portfolios most
+    # deltas are small, so the sentiment test decides the BUY chain fastest
+    # and fires most often in the SELL chain; the rare |forecast| > 2 tests
+    # come last.
+    if sentiment_score > _SENT_BUY and forecast_change > _FC_BUY and anomaly_code == 0:
+        return 1
+    if sentiment_score < _SENT_SELL or anomaly_code == 2 or forecast_change < _FC_SELL:
+        return 2
+    return 0
+
+# Warm the JIT at import so the first real call isn't slowed by compilation
+# (a no-op without numba).
+_decide(0.0, 0.0, 0)
+
+def _build_table() -> Tuple[StrategyResult, ...]:
+    # Partial evaluation: the rules only distinguish 5 sentiment bins
+    # (boundaries -0.2, -0.1, 0.1, 0.2), 3 forecast bins (±2) and 3 anomaly
+    # levels — 45 outcomes total. Run the reference logic once per cell so
+    # the per-call path is a pure index into shared (decision, reason) pairs.
+    sent_rep = (_SENT_NEG - 0.1, (_SENT_NEG + _SENT_SELL) / 2, 0.0,
+                (_SENT_BUY + _SENT_POS) / 2, _SENT_POS + 0.1)
+    fc_rep = (_FC_SELL - 1.0, 0.0, _FC_BUY + 1.0)
+    table = []
+    for si in range(5):
+        for fi in range(3):
+            for ai in range(3):
+                s, fc = sent_rep[si], fc_rep[fi]
+                decision = _DECISION[_decide(fc, s, ai)]
+                sr = 2 if s > _SENT_POS else 0 if s < _SENT_NEG else 1
+                table.append(StrategyResult(decision, sys.intern(f"{_SENT_T[sr]}; {_ANOM_T[ai]}")))
+    return tuple(table)
+
+_TABLE: Tuple[StrategyResult, ...] = _build_table()
+
+def _anomaly_codes(anomaly_level) -> np.ndarray:
+    """Coerce anomaly labels to int8 codes (0=None, 1=Mild, 2=Severe)."""
+    a = np.asarray(anomaly_level)
+    if a.dtype.kind in "UO":
+        a = np.fromiter((_ANOMALY_CODE[str(x)] for x in a.ravel()),
+                        dtype=np.int8, count=a.size)
+    return a.astype(np.int8, copy=False)
+
+def investment_strategy_batch(forecast_change, sentiment_score, anomaly_level) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized strategy over aligned 1-D arrays (e.g. a whole portfolio).
+
+    forecast_change: array of forecast % changes
+    sentiment_score: array of VADER compounds (-1..1)
+    anomaly_level: array of labels ("None"/"Mild"/"Severe") or int codes (0/1/2)
+    Returns: (decisions, reasons) string arrays, same rules as investment_strategy.
+    """
+    fc = np.asarray(forecast_change, dtype=np.float64)
+    s = np.asarray(sentiment_score, dtype=np.float64)
+    a = _anomaly_codes(anomaly_level)
+
+    buy = (fc > _FC_BUY) & (s > _SENT_BUY) & (a == 0)
+    sell = (fc < _FC_SELL) | (s < _SENT_SELL) | (a == 2)
+    decisions = np.select([buy, sell], ["BUY", "SELL"], default="HOLD")
+
+    # Explicit comparisons (not digitize) so the threshold boundaries match
+    # the scalar path exactly: negative strictly below _SENT_NEG, positive
+    # strictly above _SENT_POS.
+    si = (s >= _SENT_NEG).astype(np.int8) + (s > _SENT_POS)
+    sent_reason = _SENT_REASON[si]
+    reasons = np.char.add(np.char.add(sent_reason, "; "), _ANOM_REASON[a])
+    return decisions, reasons
+
+def investment_strategy_df(df, fc_col: str = "forecast_change",
+                           sent_col: str = "sentiment", anom_col: str = "anomaly"):
+    """
+    Full-column strategy evaluation for a signals DataFrame — the
+    vectorized replacement for df.apply(investment_strategy, axis=1),
+    which pays a Python call plus Series indexing per row.
+
+    anom_col may hold labels ("None"/"Mild"/"Severe") or int codes (0/1/2).
+    Returns a copy of df with 'decision' and 'reason' columns added.
+    """
+    fc = df[fc_col].to_numpy(dtype=np.float64)
+    s = df[sent_col].to_numpy(dtype=np.float64)
+    a = _anomaly_codes(df[anom_col].to_numpy())
+    decisions, reasons = investment_strategy_batch(fc, s, a)
+    return df.assign(decision=decisions, reason=reasons)
+
+def investment_strategy(forecast_change: float, sentiment_score: float, anomaly_level: str) -> StrategyResult:
     """
     forecast_change: % change from forecast (float)
     sentiment_score: VADER compound (-1..1)
-    anomaly_level: "None" | "Mild" | "Severe"
-    """
-    reasons = []
-
-    # Sentiment
-    if sentiment_score > 0.2:
-        reasons.append("Positive sentiment")
-    elif sentiment_score < -0.2:
-        reasons.append("Negative sentiment")
-    else:
-        reasons.append("Neutral sentiment")
-
-    # Anomaly
-    if anomaly_level == "Severe":
-        reasons.append("Severe anomalies detected")
-    elif anomaly_level == "Mild":
-        reasons.append("Mild anomalies detected")
-    else:
-        reasons.append("No anomalies detected")
-
-    # Decision rules
-    if forecast_change > 2 and sentiment_score > 0.1 and anomaly_level == "None":
-        decision = "BUY"
-    elif forecast_change < -2 or sentiment_score < -0.1 or anomaly_level == "Severe":
-        decision = "SELL"
-    else:
-        decision = "HOLD"
-
-    reason_text = "; ".join(reasons)
-    return decision, reason_text
+    anomaly_level: "None" | "Mild" | "Severe" (or an int/AnomalyLevel code 0/1/2)
+    """
+    ai: int = _ANOMALY_CODE[anomaly_level] if isinstance(anomaly_level, str) else int(anomaly_level)
+    s: float = float(sentiment_score)
+    fc: float = float(forecast_change)
+    si: int = (s >= _SENT_NEG) + (s >= _SENT_SELL) + (s > _SENT_BUY) + (s > _SENT_POS)
+    fi: int = (fc >= _FC_SELL) + (fc > _FC_BUY)
+    return _TABLE[(si * 3 + fi) * 3 + ai]
+
+# Decision codes matching _decide's return values.
+HOLD, BUY, SELL = 0, 1, 2
+
+if _HAVE_NUMBA:
+    from numba import vectorize
+
+    def _decide_codes_py(forecast_change, sentiment_score, anomaly_code):
+        # True NumPy ufunc once compiled: broadcasting and chunking in C.
+        # Same predicate order as _decide (most-selective first).
+        if sentiment_score > _SENT_BUY and forecast_change > _FC_BUY and anomaly_code == 0:
+            return 1
+        if sentiment_score < _SENT_SELL or anomaly_code == 2 or forecast_change < _FC_SELL:
+            return 2
+        return 0
+
+    def _reason_codes_py(forecast_change, sentiment_score, anomaly_code):
+        if sentiment_score > _SENT_POS:
+            si = 2
+        elif sentiment_score < _SENT_NEG:
+            si = 0
+        else:
+            si = 1
+        return (si << 2) | anomaly_code
+
+    # Explicit signatures make @vectorize compile eagerly, so target/cache
+    # problems surface here — guard the decorator *application*, not its
+    # construction, and retry on the serial target (plain C loop is fine)
+    # when e.g. no threading layer is available.
+    try:
+        decide_codes = vectorize(["int8(float64, float64, int8)"],
+                                 target="parallel", cache=True)(_decide_codes_py)
+        reason_codes = vectorize(["int8(float64, float64, int8)"],
+                                 target="parallel", cache=True)(_reason_codes_py)
+    except Exception:
+        decide_codes = vectorize(["int8(float64, float64, int8)"], cache=True)(_decide_codes_py)
+        reason_codes = vectorize(["int8(float64, float64, int8)"], cache=True)(_reason_codes_py)
+
+else:
+
+    def decide_codes(forecast_change, sentiment_score, anomaly_code):
+        """NumPy fallback with the same broadcasting semantics as the ufunc."""
+        fc = np.asarray(forecast_change, dtype=np.float64)
+        s = np.asarray(sentiment_score, dtype=np.float64)
+        a = np.asarray(anomaly_code, dtype=np.int8)
+        buy = (fc > _FC_BUY) & (s > _SENT_BUY) & (a == 0)
+        sell = (fc < _FC_SELL) | (s < _SENT_SELL) | (a == 2)
+        return np.select([buy, sell], [BUY, SELL], default=HOLD).astype(np.int8)
+
+    def reason_codes(forecast_change, sentiment_score, anomaly_code):
+        s = np.asarray(sentiment_score, dtype=np.float64)
+        a = np.asarray(anomaly_code, dtype=np.int8)
+        # Same strict boundaries as the numba ufunc twin.
+        si = (s >= _SENT_NEG).astype(np.int8) + (s > _SENT_POS)
+        return (si << 2) | a
+
+# All 9 possible reason codes ((sent_bin << 2) | anomaly_code), preformatted.
+_REASON_BY_CODE: Dict[int, str] = {
+    (si << 2) | ai: sys.intern(f"{_SENT_T[si]}; {_ANOM_T[ai]}")
+    for si in range(3) for ai in range(3)
+}
+
+def decide(forecast_change: float, sentiment_score: float, anomaly_code: int) -> Tuple[int, int]:
+    """Allocation-light strategy call for backtests: small ints in, small ints out.
+
+    Returns (decision_code, reason_code) where decision_code is HOLD/BUY/SELL
+    (0/1/2) and reason_code packs the sentiment bin and anomaly code as
+    (sent_bin << 2) | anomaly_code. Format reason_code with explain() only
+    when a human actually reads it.
+    """
+    s = float(sentiment_score)
+    d: int = _decide(float(forecast_change), s, int(anomaly_code))
+    si: int = 2 if s > _SENT_POS else 0 if s < _SENT_NEG else 1
+    return d, (si << 2) | int(anomaly_code)
+
+def explain(reason_code: int) -> str:
+    """Render a reason_code from decide() as the usual reason text."""
+    return _REASON_BY_CODE[reason_code]
+
+@lru_cache(maxsize=4096)
+def _strategy_from_ticks(fc_tick: int, s_tick: int, anomaly_code: int) -> StrategyResult:
+    # Integer-only binning against tick-scaled thresholds (x100).
+    si: int = ((s_tick >= _SENT_NEG_TICK) + (s_tick >= _SENT_SELL_TICK)
+               + (s_tick > _SENT_BUY_TICK) + (s_tick > _SENT_POS_TICK))
+    fi: int = (fc_tick >= _FC_SELL_TICK) + (fc_tick > _FC_BUY_TICK)
+    return _TABLE[(si * 3 + fi) * 3 + anomaly_code]
+
+def investment_strategy_cached(forecast_change: float, sentiment_score: float, anomaly_level) -> StrategyResult:
+    """Memoized variant for backtest loops with recurring inputs.
+
+    Quantizes both floats to 0.01 ticks so repeated (forecast, sentiment,
+    anomaly) triples collapse to a single cached cell; a hit is one dict
+    lookup. anomaly_level may be a label string or an int code.
+    """
+    ai = _ANOMALY_CODE[anomaly_level] if isinstance(anomaly_level, str) else int(anomaly_level)
+    return _strategy_from_ticks(int(round(float(forecast_change) * 100)),
+                                int(round(float(sentiment_score) * 100)), ai)